@@ -4,12 +4,13 @@ from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-import crud, models
+import crud, models, schemas
 from config import settings
-from database import get_db
+from database import SessionLocal, get_db, read_session, user_recently_wrote
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
@@ -35,32 +36,76 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
+def _credentials_exception():
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def _decode_token(token: str):
+    credentials_exception = _credentials_exception()
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
         # Create TokenData instance properly
-        from . import schemas
-        token_data = schemas.TokenData(email=email, is_admin=payload.get("is_admin", False))
+        return schemas.TokenData(email=email, is_admin=payload.get("is_admin", False))
     except JWTError:
         raise credentials_exception
-    
+
+def _get_user_for_token(token: str, db: Session):
+    token_data = _decode_token(token)
     user = crud.get_user_by_email(db, email=token_data.email)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
 
-async def get_current_admin_user(current_user: models.User = Depends(get_current_user)):
-    if not current_user.is_admin:
+def _require_admin(user: models.User):
+    if not user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
-    return current_user
\ No newline at end of file
+    return user
+
+async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    return _get_user_for_token(token, db)
+
+async def get_current_admin_user(current_user: models.User = Depends(get_current_user)):
+    return _require_admin(current_user)
+
+def get_token_read_db(token: str = Depends(oauth2_scheme)):
+    token_data = _decode_token(token)
+    # Keep the user on the primary right after their own writes so replica lag doesn't hide them
+    yield from read_session(use_primary=user_recently_wrote(token_data.email))
+
+def get_optional_token_read_db(token: str = Depends(optional_oauth2_scheme)):
+    """Read session for public endpoints; a valid token still gets read-your-writes."""
+    email = None
+    if token:
+        try:
+            email = _decode_token(token).email
+        except HTTPException:
+            # Public endpoints don't reject bad tokens, they just read from a replica
+            pass
+    yield from read_session(use_primary=email is not None and user_recently_wrote(email))
+
+async def get_current_reader(token: str = Depends(oauth2_scheme), db: Session = Depends(get_token_read_db)):
+    """Like get_current_user, but looks the user up on the request's read session."""
+    token_data = _decode_token(token)
+    user = crud.get_user_by_email(db, email=token_data.email)
+    if user is None and db.info.get("read_only"):
+        # A user missing from the replica may just not have replicated yet
+        primary = SessionLocal()
+        try:
+            user = crud.get_user_by_email(primary, email=token_data.email)
+        finally:
+            primary.close()
+    if user is None:
+        raise _credentials_exception()
+    return user
+
+async def get_current_admin_reader(current_user: models.User = Depends(get_current_reader)):
+    return _require_admin(current_user)
\ No newline at end of file
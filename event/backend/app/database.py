@@ -1,15 +1,146 @@
-from sqlalchemy import create_engine
+import threading
+import time
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
 from config import settings
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _make_engine(url: str, replica: bool = False):
+    connect_args = {}
+    if url.startswith("sqlite"):
+        # SQLite connections are opened in the request thread but used from the threadpool
+        connect_args["check_same_thread"] = False
+    if not replica:
+        return create_engine(url, connect_args=connect_args)
+    # Replicas can disappear independently of the primary, so fail fast and drop stale connections
+    if url.startswith("mysql"):
+        connect_args["connect_timeout"] = settings.REPLICA_CONNECT_TIMEOUT_SECONDS
+    return create_engine(url, connect_args=connect_args, pool_pre_ping=True)
+
+engine = _make_engine(settings.DATABASE_URL)
+replica_engines = [_make_engine(url, replica=True) for url in settings.DATABASE_REPLICA_URLS]
+# Query an app table so a replica that is up but missing the schema also fails the check
+HEALTH_CHECK_QUERY = "SELECT 1 FROM users LIMIT 1"
+
+class ReplicaPool:
+    """Round-robin over replica engines, skipping ones that failed a health check.
+
+    Health checks run on a background thread; choose() only reads the cached status.
+    """
+
+    def __init__(self, engines, check_interval: int):
+        self.engines = engines
+        self.check_interval = check_interval
+        self._next = 0
+        self._lock = threading.Lock()
+        # Replicas count as healthy until a check or a failed query says otherwise
+        self._healthy = [True] * len(engines)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _ping(self, index: int) -> bool:
+        try:
+            with self.engines[index].connect() as conn:
+                conn.execute(text(HEALTH_CHECK_QUERY))
+            return True
+        except Exception as e:
+            if self._healthy[index]:
+                print(f"⚠️ Read replica {index} failed health check: {e}")
+            return False
+
+    def check_all(self):
+        for index in range(len(self.engines)):
+            # Ping outside the lock so a slow replica never blocks choose()
+            healthy = self._ping(index)
+            with self._lock:
+                self._healthy[index] = healthy
+
+    def _run(self):
+        while not self._stop.wait(self.check_interval):
+            self.check_all()
+
+    def start(self):
+        """Check every replica once, then keep re-checking in the background."""
+        if not self.engines or self._thread is not None:
+            return
+        self.check_all()
+        self._thread = threading.Thread(target=self._run, name="replica-health", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def mark_unhealthy(self, engine):
+        if engine in self.engines:
+            with self._lock:
+                self._healthy[self.engines.index(engine)] = False
+
+    def choose(self):
+        """Return the next healthy replica engine, or the primary if none are usable."""
+        with self._lock:
+            for _ in range(len(self.engines)):
+                index = self._next
+                self._next = (self._next + 1) % len(self.engines)
+                if self._healthy[index]:
+                    return self.engines[index]
+        return engine
+
+replica_pool = ReplicaPool(replica_engines, settings.REPLICA_HEALTH_CHECK_SECONDS)
+
+class RoutingSession(Session):
+    """Sends reads to the replica picked for this session and everything else to the primary.
+
+    Sessions are write sessions unless created with info={"read_only": True}; flushes
+    always go to the primary so an accidental write never lands on a replica.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or not self.info.get("read_only"):
+            return engine
+        if "replica" not in self.info:
+            self.info["replica"] = replica_pool.choose()
+        return self.info["replica"]
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, class_=RoutingSession)
 Base = declarative_base()
 
+# user email -> monotonic time of that user's last write. This lives in process memory,
+# so the read-your-writes window only holds when uvicorn runs a single worker.
+_recent_writes = {}
+_recent_writes_lock = threading.Lock()
+
+def mark_user_write(email: str):
+    """Pin the user's reads to the primary for READ_YOUR_WRITES_SECONDS."""
+    now = time.monotonic()
+    with _recent_writes_lock:
+        # Drop expired windows so users who never read again don't pile up
+        for key, written_at in list(_recent_writes.items()):
+            if now - written_at >= settings.READ_YOUR_WRITES_SECONDS:
+                del _recent_writes[key]
+        _recent_writes[email] = now
+
+def user_recently_wrote(email: str) -> bool:
+    written_at = _recent_writes.get(email)
+    return written_at is not None and time.monotonic() - written_at < settings.READ_YOUR_WRITES_SECONDS
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def read_session(use_primary: bool = False):
+    db = SessionLocal(info={"read_only": not use_primary})
+    try:
+        yield db
+    except DBAPIError:
+        # A replica that errored mid-request (down, or missing tables) is skipped until the next health check passes
+        replica_pool.mark_unhealthy(db.info.get("replica"))
+        raise
+    finally:
+        db.close()
+
+def get_read_db():
+    yield from read_session()
\ No newline at end of file
@@ -9,7 +9,7 @@ import os
 from pathlib import Path
 
 import models, schemas, crud, auth, email
-from database import SessionLocal, engine, get_db
+from database import SessionLocal, engine, get_db, get_read_db, mark_user_write, replica_pool
 from config import settings
 
 # Create tables
@@ -74,6 +74,11 @@ def create_initial_data():
 @app.on_event("startup")
 def startup_event():
     create_initial_data()
+    replica_pool.start()
+
+@app.on_event("shutdown")
+def shutdown_event():
+    replica_pool.stop()
 
 # Serve HTML pages
 @app.get("/", response_class=HTMLResponse)
@@ -121,11 +126,13 @@ def register_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
     db_user = crud.get_user_by_email(db, email=user.email)
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
-    return crud.create_user(db=db, user=user)
+    db_user = crud.create_user(db=db, user=user)
+    mark_user_write(db_user.email)
+    return db_user
 
 # Event routes
 @app.get("/events", response_model=list[schemas.Event])
-def read_events(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def read_events(skip: int = 0, limit: int = 100, db: Session = Depends(auth.get_optional_token_read_db)):
     events = crud.get_events(db, skip=skip, limit=limit)
     return events
 
@@ -135,7 +142,9 @@ def create_event(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_admin_user)
 ):
-    return crud.create_event(db=db, event=event)
+    db_event = crud.create_event(db=db, event=event)
+    mark_user_write(current_user.email)
+    return db_event
 
 # Registration routes
 @app.post("/registrations", response_model=schemas.Registration)
@@ -148,6 +157,7 @@ async def register_for_event(
     db_registration = crud.create_registration(db=db, registration=registration, user_id=current_user.id)
     if not db_registration:
         raise HTTPException(status_code=400, detail="Already registered for this event")
+    mark_user_write(current_user.email)
     
     # Get event details
     event = crud.get_event(db, registration.event_id)
@@ -165,8 +175,8 @@ async def register_for_event(
 
 @app.get("/my-registrations", response_model=list[schemas.RegistrationWithDetails])
 def get_my_registrations(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_user)
+    db: Session = Depends(auth.get_token_read_db),
+    current_user: models.User = Depends(auth.get_current_reader)
 ):
     registrations = crud.get_user_registrations(db, current_user.id)
     return registrations
@@ -181,6 +191,7 @@ def verify_qr_code(
     registration = crud.verify_registration(db, qr_data.qr_code_data)
     if not registration:
         raise HTTPException(status_code=404, detail="Invalid QR code or already verified")
+    mark_user_write(current_user.email)
     
     return {
         "message": "Registration verified successfully",
@@ -191,8 +202,8 @@ def verify_qr_code(
 
 @app.get("/admin/registrations", response_model=list[schemas.RegistrationWithDetails])
 def get_all_registrations(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_admin_user)
+    db: Session = Depends(auth.get_token_read_db),
+    current_user: models.User = Depends(auth.get_current_admin_reader)
 ):
     registrations = crud.get_all_registrations(db)
     return registrations
@@ -204,7 +215,7 @@ def health_check():
 
 # Debug endpoint
 @app.get("/debug/db")
-def debug_db(db: Session = Depends(get_db)):
+def debug_db(db: Session = Depends(get_read_db)):
     users = db.query(models.User).all()
     events = db.query(models.Event).all()
     registrations = db.query(models.Registration).all()
@@ -0,0 +1,30 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# One primary and two replica SQLite files; config reads these at import time
+_db_dir = Path(tempfile.mkdtemp(prefix="event-db-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir / 'primary.db'}"
+os.environ["DATABASE_REPLICA_URLS"] = f"sqlite:///{_db_dir / 'replica1.db'},sqlite:///{_db_dir / 'replica2.db'}"
+os.environ["READ_YOUR_WRITES_SECONDS"] = "60"
+
+# Appended rather than prepended so app/email.py doesn't shadow the stdlib email package
+sys.path.append(str(Path(__file__).resolve().parent.parent / "app"))
+
+import database  # noqa: E402
+import models  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def replica_pool(monkeypatch):
+    # No replication between the files, so every database gets its own schema
+    for engine in [database.engine, *database.replica_engines]:
+        models.Base.metadata.drop_all(bind=engine)
+        models.Base.metadata.create_all(bind=engine)
+    pool = database.ReplicaPool(database.replica_engines, check_interval=30)
+    monkeypatch.setattr(database, "replica_pool", pool)
+    monkeypatch.setattr(database, "_recent_writes", {})
+    return pool
\ No newline at end of file
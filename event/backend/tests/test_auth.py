@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import auth
+import database
+import models
+from database import SessionLocal, mark_user_write
+
+
+def _add_user(engine, email, is_admin=False):
+    db = SessionLocal(bind=engine)
+    db.add(models.User(email=email, full_name="Test User", hashed_password="x", is_admin=is_admin))
+    db.commit()
+    db.close()
+
+
+def _token(email):
+    return auth.create_access_token({"sub": email})
+
+
+def _session_from(dependency, *args):
+    gen = dependency(*args)
+    return gen, next(gen)
+
+
+def test_decode_token_rejects_bad_token():
+    with pytest.raises(HTTPException) as exc:
+        auth._decode_token("not-a-token")
+    assert exc.value.status_code == 401
+
+
+def test_decode_token_returns_email():
+    assert auth._decode_token(_token("attendee@example.com")).email == "attendee@example.com"
+
+
+def test_token_read_db_uses_replica_by_default():
+    gen, db = _session_from(auth.get_token_read_db, _token("attendee@example.com"))
+    assert db.get_bind() is database.replica_engines[0]
+    gen.close()
+
+
+def test_token_read_db_uses_primary_after_own_write():
+    mark_user_write("attendee@example.com")
+    gen, db = _session_from(auth.get_token_read_db, _token("attendee@example.com"))
+    assert db.get_bind() is database.engine
+    gen.close()
+
+
+@pytest.mark.parametrize("token", [None, "not-a-token", _token("someone@example.com")], ids=["anonymous", "bad-token", "other-user"])
+def test_optional_token_read_db_uses_replica(token):
+    mark_user_write("attendee@example.com")
+    gen, db = _session_from(auth.get_optional_token_read_db, token)
+    assert db.get_bind() is database.replica_engines[0]
+    gen.close()
+
+
+def test_optional_token_read_db_uses_primary_after_own_write():
+    mark_user_write("attendee@example.com")
+    gen, db = _session_from(auth.get_optional_token_read_db, _token("attendee@example.com"))
+    assert db.get_bind() is database.engine
+    gen.close()
+
+
+def test_current_reader_found_on_replica():
+    _add_user(database.replica_engines[0], "attendee@example.com")
+    gen, db = _session_from(auth.get_token_read_db, _token("attendee@example.com"))
+    user = asyncio.run(auth.get_current_reader(_token("attendee@example.com"), db))
+    assert user.email == "attendee@example.com"
+    gen.close()
+
+
+def test_current_reader_falls_back_to_primary_when_replica_lags():
+    _add_user(database.engine, "attendee@example.com")
+    gen, db = _session_from(auth.get_token_read_db, _token("attendee@example.com"))
+    user = asyncio.run(auth.get_current_reader(_token("attendee@example.com"), db))
+    assert user.email == "attendee@example.com"
+    gen.close()
+
+
+def test_current_reader_rejects_unknown_user():
+    gen, db = _session_from(auth.get_token_read_db, _token("ghost@example.com"))
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(auth.get_current_reader(_token("ghost@example.com"), db))
+    assert exc.value.status_code == 401
+    gen.close()
+
+
+def test_current_admin_reader_requires_admin():
+    _add_user(database.engine, "attendee@example.com")
+    _add_user(database.engine, "admin@example.com", is_admin=True)
+    db = SessionLocal()
+    attendee = db.query(models.User).filter_by(email="attendee@example.com").one()
+    admin = db.query(models.User).filter_by(email="admin@example.com").one()
+    db.close()
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(auth.get_current_admin_reader(attendee))
+    assert exc.value.status_code == 403
+    assert asyncio.run(auth.get_current_admin_reader(admin)) is admin
\ No newline at end of file
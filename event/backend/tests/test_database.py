@@ -0,0 +1,123 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import DBAPIError
+
+import database
+import models
+from database import SessionLocal, ReplicaPool, get_read_db, read_session, mark_user_write, user_recently_wrote
+
+
+def _bound_engine(dependency):
+    gen = dependency()
+    db = next(gen)
+    try:
+        return db.get_bind()
+    finally:
+        gen.close()
+
+
+def _event(title):
+    return models.Event(title=title, description="", date=datetime(2030, 1, 1), location="Hall", max_attendees=10)
+
+
+def test_writes_go_to_primary():
+    db = SessionLocal()
+    db.add(_event("Launch"))
+    db.commit()
+    assert db.get_bind() is database.engine
+    db.close()
+
+    for engine in database.replica_engines:
+        with engine.connect() as conn:
+            assert conn.execute(models.Event.__table__.select()).first() is None
+
+
+def test_flush_from_read_session_goes_to_primary():
+    gen = get_read_db()
+    db = next(gen)
+    db.add(_event("Launch"))
+    db.commit()
+    gen.close()
+
+    primary = SessionLocal()
+    assert primary.query(models.Event).count() == 1
+    primary.close()
+
+
+def test_reads_rotate_between_replicas():
+    first, second = database.replica_engines
+    assert [_bound_engine(get_read_db) for _ in range(4)] == [first, second, first, second]
+
+
+def test_read_session_queries_the_replica():
+    replica = database.replica_engines[0]
+    with replica.begin() as conn:
+        conn.execute(models.Event.__table__.insert().values(title="Replicated", description="", date=datetime(2030, 1, 1), location="Hall", max_attendees=10))
+
+    gen = get_read_db()
+    db = next(gen)
+    assert [e.title for e in db.query(models.Event).all()] == ["Replicated"]
+    gen.close()
+
+
+def test_unhealthy_replica_is_skipped(replica_pool):
+    first, second = database.replica_engines
+    replica_pool.mark_unhealthy(first)
+    assert [_bound_engine(get_read_db) for _ in range(3)] == [second, second, second]
+
+
+def test_failed_health_check_marks_replica_unhealthy(tmp_path, monkeypatch):
+    dead = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    live = database.replica_engines[1]
+    pool = ReplicaPool([dead, live], check_interval=30)
+    monkeypatch.setattr(database, "replica_pool", pool)
+    pool.check_all()
+    assert [pool.choose() for _ in range(2)] == [live, live]
+
+
+def test_all_replicas_unhealthy_falls_back_to_primary(replica_pool):
+    for engine in database.replica_engines:
+        replica_pool.mark_unhealthy(engine)
+    assert _bound_engine(get_read_db) is database.engine
+
+
+def test_reads_stay_on_primary_after_own_write():
+    mark_user_write("attendee@example.com")
+    assert user_recently_wrote("attendee@example.com")
+    assert not user_recently_wrote("someone@example.com")
+
+    gen = read_session(use_primary=user_recently_wrote("attendee@example.com"))
+    assert next(gen).get_bind() is database.engine
+    gen.close()
+
+
+def test_read_your_writes_window_expires(monkeypatch):
+    mark_user_write("attendee@example.com")
+    monkeypatch.setattr(database.settings, "READ_YOUR_WRITES_SECONDS", 0)
+    assert not user_recently_wrote("attendee@example.com")
+
+    mark_user_write("someone@example.com")
+    assert "attendee@example.com" not in database._recent_writes
+
+def test_replica_missing_schema_fails_health_check(tmp_path):
+    empty = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+    live = database.replica_engines[1]
+    pool = ReplicaPool([empty, live], check_interval=30)
+    pool.check_all()
+    assert [pool.choose() for _ in range(2)] == [live, live]
+
+
+def test_query_error_marks_replica_unhealthy(replica_pool):
+    first, second = database.replica_engines
+    models.Base.metadata.drop_all(bind=first)
+
+    gen = get_read_db()
+    db = next(gen)
+    with pytest.raises(DBAPIError) as exc:
+        db.query(models.Event).all()
+    # FastAPI throws endpoint errors back into the dependency
+    with pytest.raises(DBAPIError):
+        gen.throw(exc.value)
+    assert [replica_pool.choose() for _ in range(2)] == [second, second]
\ No newline at end of file
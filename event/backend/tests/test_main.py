@@ -0,0 +1,83 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import auth
+import database
+import main
+import models
+from database import SessionLocal
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Don't send registration emails from tests
+    monkeypatch.setattr(main, "email", SimpleNamespace(send_registration_email=lambda *args: None))
+    return TestClient(main.app)
+
+
+def _add_primary(*objects):
+    db = SessionLocal()
+    db.add_all(objects)
+    db.commit()
+    ids = [obj.id for obj in objects]
+    db.close()
+    return ids
+
+
+def _user(email, is_admin=False):
+    return models.User(email=email, full_name="Test User", hashed_password=auth.get_password_hash("secret"), is_admin=is_admin)
+
+
+def _event(title):
+    return models.Event(title=title, description="", date=datetime(2030, 1, 1), location="Hall", max_attendees=10)
+
+
+def _login(client, email):
+    response = client.post("/token", data={"username": email, "password": "secret"})
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_new_user_can_read_own_registrations_before_replica_catches_up(client):
+    response = client.post("/register", json={"email": "new@example.com", "full_name": "New User", "password": "secret"})
+    assert response.status_code == 200
+
+    response = client.get("/my-registrations", headers=_login(client, "new@example.com"))
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_registration_is_visible_right_after_registering(client):
+    _add_primary(_user("attendee@example.com"))
+    event_id, = _add_primary(_event("Launch"))
+    headers = _login(client, "attendee@example.com")
+
+    assert client.post("/registrations", json={"event_id": event_id}, headers=headers).status_code == 200
+    response = client.get("/my-registrations", headers=headers)
+    assert [r["event_id"] for r in response.json()] == [event_id]
+
+
+def test_verification_is_visible_right_after_verifying(client):
+    _add_primary(_user("admin@example.com", is_admin=True), _user("attendee@example.com"))
+    event_id, = _add_primary(_event("Launch"))
+    registration = client.post("/registrations", json={"event_id": event_id}, headers=_login(client, "attendee@example.com")).json()
+    headers = _login(client, "admin@example.com")
+
+    response = client.post("/admin/verify-qr", json={"qr_code_data": registration["qr_code_data"]}, headers=headers)
+    assert response.status_code == 200
+    response = client.get("/admin/registrations", headers=headers)
+    assert [r["is_verified"] for r in response.json()] == [True]
+
+
+def test_admin_sees_event_they_just_created(client):
+    _add_primary(_user("admin@example.com", is_admin=True))
+    headers = _login(client, "admin@example.com")
+
+    event = {"title": "Launch", "date": "2030-01-01T00:00:00"}
+    assert client.post("/events", json=event, headers=headers).status_code == 200
+    assert [e["title"] for e in client.get("/events", headers=headers).json()] == ["Launch"]
+    # Anonymous reads still go to the lagging replica
+    assert client.get("/events").json() == []
\ No newline at end of file
@@ -0,0 +1,11 @@
+-- Start replicating from the primary once the replica's data directory is initialised.
+-- The primary's own init (root user, event_db) is not binlogged, so only app writes replicate.
+CHANGE REPLICATION SOURCE TO
+    SOURCE_HOST='db',
+    SOURCE_USER='root',
+    SOURCE_PASSWORD='root',
+    SOURCE_AUTO_POSITION=1,
+    GET_SOURCE_PUBLIC_KEY=1;
+START REPLICA;
+-- Set last so the entrypoint's own init writes still succeed; persists across restarts.
+SET PERSIST super_read_only = ON;
\ No newline at end of file
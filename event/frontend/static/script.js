@@ -463,7 +463,9 @@ async function loadEvents() {
     showLoading('events-list', 'Loading events...');
     
     try {
-        const response = await fetch(`${API_BASE}/events`);
+        // Send the token when logged in so an admin sees events they just created
+        const headers = currentToken ? { 'Authorization': `Bearer ${currentToken}` } : {};
+        const response = await fetch(`${API_BASE}/events`, { headers });
         if (!response.ok) {
             throw new Error('Failed to fetch events');
         }